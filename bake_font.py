@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# Wypieka font z ascii.png do jednego arkusza dla TextRenderer:
+# wybrane skale GUI (1x-4x) x kolory z kodów § + kolor cienia.
+# Klient tylko kopiuje gotowe glify (drawImage 1:1) - bez skalowania
+# w runtime. Domyślnie tylko to, czego używa klient (skala 3, kolory
+# chatu, cień 0x3F3F3F), żeby arkusz był mały.
+#
+# Wszystkie 256 slotów ascii.png - bez filtra z analyze_ascii.py, który
+# gubi glify z <= 2 pikselami (np. '.').
+#
+# Wynik (ascii_baked.png/.json) jest w repo - po zmianie ascii.png albo
+# kolorów w chatManager.js/guiManager.js uruchom ponownie:
+#   python bake_font.py
+#
+# Arkusz ma max 4096x4096 px (sprawdzane dla szerokości i wysokości).
+# Pełne 1x-4x ze wszystkimi 16 kolorami mieści się tylko z jednym
+# kolorem cienia (2048x2720, ~22 MB RGBA po dekodowaniu) - osobne cienie
+# dla każdego koloru by się nie zmieściły. Wypiekaj tylko potrzebne
+# skale i kolory.
+import argparse
+import json
+import os
+import sys
+
+from PIL import Image
+
+FONT_PATH = './assets/minecraft/textures/font/ascii.png'
+OUT_DIR = './assets/minecraft/textures/font'
+
+GLYPH_SIZE = 8
+SCALES = [1, 2, 3, 4]
+MAX_SHEET_SIZE = 4096
+
+# Skala, kolory i cień używane przez GuiManager/ChatManager
+DEFAULT_SCALES = '3'
+DEFAULT_COLORS = 'fae'
+DEFAULT_SHADOW = '3f3f3f'
+
+# Kody kolorów z chatu Minecrafta (§0-§f)
+COLOR_CODES = {
+    '0': 0x000000, '1': 0x0000AA, '2': 0x00AA00, '3': 0x00AAAA,
+    '4': 0xAA0000, '5': 0xAA00AA, '6': 0xFFAA00, '7': 0xAAAAAA,
+    '8': 0x555555, '9': 0x5555FF, 'a': 0x55FF55, 'b': 0x55FFFF,
+    'c': 0xFF5555, 'd': 0xFF55FF, 'e': 0xFFFF55, 'f': 0xFFFFFF,
+}
+
+
+def measure_width(glyph):
+    # Ta sama reguła co TextRenderer.measureCharacterWidths()
+    pixels = glyph.load()
+    for x in range(GLYPH_SIZE - 1, -1, -1):
+        for y in range(GLYPH_SIZE):
+            if pixels[x, y][3] > 0:
+                return x + 1
+    return 1
+
+
+def tint(glyph, color):
+    # Ta sama reguła co TextRenderer.drawTintedGlyph() - podmiana RGB
+    r, g, b = (color >> 16) & 0xff, (color >> 8) & 0xff, color & 0xff
+    out = glyph.copy()
+    pixels = out.load()
+    for y in range(out.height):
+        for x in range(out.width):
+            pa = pixels[x, y][3]
+            if pa > 0:
+                pixels[x, y] = (r, g, b, pa)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Wypiekanie fontu ascii.png do arkusza')
+    parser.add_argument('--colors', default=DEFAULT_COLORS,
+                        help=f'kody kolorów do wypieczenia (domyślnie "{DEFAULT_COLORS}", '
+                             f'wszystkie: "{"".join(COLOR_CODES)}")')
+    parser.add_argument('--scales', default=DEFAULT_SCALES,
+                        help=f'skale GUI, np. "1,2,3,4" (domyślnie "{DEFAULT_SCALES}")')
+    parser.add_argument('--shadow', default=DEFAULT_SHADOW,
+                        help=f'kolor cienia (hex) z shadowConfig klienta (domyślnie {DEFAULT_SHADOW})')
+    parser.add_argument('--max-width', type=int, default=2048,
+                        help=f'maksymalna szerokość arkusza w px (max {MAX_SHEET_SIZE})')
+    parser.add_argument('--out', default='ascii_baked',
+                        help='nazwa plików wyjściowych (bez rozszerzenia)')
+    args = parser.parse_args()
+
+    scales = sorted({int(s) for s in args.scales.split(',') if s})
+    if not scales or any(s not in SCALES for s in scales):
+        print(f"Nieprawidłowe skale: {args.scales} (dozwolone {SCALES})")
+        sys.exit(1)
+
+    unknown = [c for c in args.colors if c not in COLOR_CODES]
+    if unknown:
+        print(f"Nieznane kody kolorów: {''.join(unknown)}")
+        sys.exit(1)
+
+    if not 0 < args.max_width <= MAX_SHEET_SIZE:
+        print(f"Nieprawidłowa szerokość: {args.max_width} (max {MAX_SHEET_SIZE})")
+        sys.exit(1)
+
+    shadow = int(args.shadow, 16)
+
+    img = Image.open(FONT_PATH).convert('RGBA')
+    codes = range(256)
+
+    # Glify przycięte do szerokości (skala 1x, białe)
+    glyphs = {}
+    widths = {}
+    for code in codes:
+        x = (code % 16) * GLYPH_SIZE
+        y = (code // 16) * GLYPH_SIZE
+        glyph = img.crop((x, y, x + GLYPH_SIZE, y + GLYPH_SIZE))
+        widths[code] = measure_width(glyph)
+        glyphs[code] = glyph.crop((0, 0, widths[code], GLYPH_SIZE))
+
+    # Warianty: kolory tekstu + jeden kolor cienia (bez duplikatów)
+    colors = []
+    for color in [COLOR_CODES[c] for c in args.colors] + [shadow]:
+        if color not in colors:
+            colors.append(color)
+
+    # Pakowanie półkowe: wiersz = wysokość glifu w danej skali
+    placements = []
+    cursor_x, cursor_y, row_height, sheet_width = 0, 0, 0, 0
+    for scale in scales:
+        for color in colors:
+            for code in codes:
+                w = widths[code] * scale
+                h = GLYPH_SIZE * scale
+                if cursor_x + w > args.max_width or (row_height and h != row_height):
+                    cursor_x = 0
+                    cursor_y += row_height
+                    row_height = 0
+                placements.append((scale, color, code, cursor_x, cursor_y))
+                cursor_x += w
+                row_height = h
+                sheet_width = max(sheet_width, cursor_x)
+    sheet_height = cursor_y + row_height
+
+    if sheet_width > MAX_SHEET_SIZE or sheet_height > MAX_SHEET_SIZE:
+        print(f"Arkusz miałby {sheet_width}x{sheet_height}px (max {MAX_SHEET_SIZE}) - "
+              f"użyj mniej kolorów (--colors) lub skal (--scales)")
+        sys.exit(1)
+
+    sheet = Image.new('RGBA', (sheet_width, sheet_height), (0, 0, 0, 0))
+    tinted = {}
+    metrics = {}
+    for scale, color, code, x, y in placements:
+        key = (color, code)
+        if key not in tinted:
+            tinted[key] = tint(glyphs[code], color)
+        glyph = tinted[key].resize(
+            (widths[code] * scale, GLYPH_SIZE * scale), Image.Resampling.NEAREST
+        )
+        sheet.paste(glyph, (x, y))
+
+        variant = metrics.setdefault(str(scale), {}).setdefault(f'{color:06x}', {})
+        variant[str(code)] = [x, y]
+
+    png_path = os.path.join(OUT_DIR, f'{args.out}.png')
+    json_path = os.path.join(OUT_DIR, f'{args.out}.json')
+    sheet.save(png_path, optimize=True)
+
+    with open(json_path, 'w') as f:
+        json.dump({
+            'image': f'{args.out}.png',
+            'glyphSize': GLYPH_SIZE,
+            'scales': scales,
+            'colors': {c: f'{COLOR_CODES[c]:06x}' for c in args.colors},
+            'shadow': f'{shadow:06x}',
+            'widths': {str(code): widths[code] for code in codes},
+            'glyphs': metrics,
+        }, f, separators=(',', ':'))
+
+    print(f"Arkusz: {sheet_width}x{sheet_height}, {len(codes)} znaków, "
+          f"{len(colors)} wariantów kolorów, skale {scales}")
+    print(f"Zapisano {png_path} i {json_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -369,7 +369,8 @@ export class ChatManager {
                 offsetX: 1,
                 offsetY: 1,
                 color: 0x3f3f3f
-            }
+            },
+            colorHex
         );
     }
 
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Kompiluje pliki .lang (key=value) do binarnych tablic stringów.
+# Klient (langTable.js) ładuje tylko potrzebne sekcje i szuka kluczy
+# przez hash w O(1) - bez parsowania całego pliku i bez wielkiego obiektu.
+#
+# Wynik (*.bin + *.index.json) jest w repo obok plików .lang - po zmianie
+# .lang uruchom ponownie:
+#   python compile_lang.py
+#
+# Format sekcji (.bin, little-endian):
+#   nagłówek:  'MCST', u32 wersja, u32 liczba wpisów, u32 rozmiar tablicy hash
+#   hash:      rozmiar x u32 (indeks wpisu + 1, 0 = pusty slot), linear probing
+#   wpisy:     liczba x (u32 offset klucza, u32 długość klucza,
+#                        u32 offset wartości, u32 długość wartości)
+#              posortowane po kluczu
+#   stringi:   UTF-8, offsety liczone od początku tego bloku
+import argparse
+import glob
+import json
+import os
+import struct
+
+LANG_DIR = './assets/minecraft/lang'
+
+MAGIC = b'MCST'
+VERSION = 1
+HEADER = struct.Struct('<4sIII')
+ENTRY = struct.Struct('<IIII')
+EMPTY_SLOT = 0
+
+DEFAULT_SPLIT = ['tile', 'item', 'gui']
+REST_SECTION = 'misc'
+
+
+def fnv1a(data):
+    # FNV-1a 32-bit - ta sama funkcja jest w langTable.js
+    h = 0x811c9dc5
+    for byte in data:
+        h ^= byte
+        h = (h * 0x01000193) & 0xffffffff
+    return h
+
+
+def parse_lang(path):
+    entries = {}
+    with open(path, encoding='utf-8-sig') as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            entries[key] = value  # Duplikat = ostatni wygrywa (jak w grze)
+    return entries
+
+
+def section_for(key, split):
+    prefix = key.split('.', 1)[0]
+    return prefix if prefix in split else REST_SECTION
+
+
+def build_table(entries):
+    keys = sorted(entries)
+
+    # Tablica hash: potęga dwójki, co najmniej 2x liczba wpisów
+    size = 1
+    while size < len(keys) * 2:
+        size *= 2
+
+    blob = bytearray()
+    records = []
+    slots = [EMPTY_SLOT] * size
+    for index, key in enumerate(keys):
+        key_bytes = key.encode('utf-8')
+        value_bytes = entries[key].encode('utf-8')
+
+        key_offset = len(blob)
+        blob += key_bytes
+        value_offset = len(blob)
+        blob += value_bytes
+        records.append(ENTRY.pack(key_offset, len(key_bytes), value_offset, len(value_bytes)))
+
+        slot = fnv1a(key_bytes) & (size - 1)
+        while slots[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & (size - 1)
+        slots[slot] = index + 1
+
+    return b''.join([
+        HEADER.pack(MAGIC, VERSION, len(keys), size),
+        struct.pack(f'<{size}I', *slots),
+        *records,
+        bytes(blob),
+    ])
+
+
+def compile_lang(path, out_dir, split):
+    name = os.path.splitext(os.path.basename(path))[0]
+    entries = parse_lang(path)
+
+    sections = {}
+    for key, value in entries.items():
+        sections.setdefault(section_for(key, split), {})[key] = value
+
+    manifest = {'language': name, 'split': split, 'rest': REST_SECTION, 'sections': {}}
+    for section, section_entries in sorted(sections.items()):
+        file_name = f'{name}.{section}.bin'
+        data = build_table(section_entries)
+        with open(os.path.join(out_dir, file_name), 'wb') as f:
+            f.write(data)
+        manifest['sections'][section] = {'file': file_name, 'count': len(section_entries)}
+        print(f"  {file_name}: {len(section_entries)} kluczy, {len(data)} B")
+
+    with open(os.path.join(out_dir, f'{name}.index.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Kompilator plików .lang do binarnych tablic stringów')
+    parser.add_argument('files', nargs='*',
+                        help=f'pliki .lang (domyślnie wszystkie z {LANG_DIR})')
+    parser.add_argument('--split', default=','.join(DEFAULT_SPLIT),
+                        help='prefiksy kluczy z osobnymi sekcjami, np. "tile,item,gui" '
+                             '("" = jedna sekcja)')
+    parser.add_argument('--out', default=LANG_DIR, help='katalog wyjściowy')
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(LANG_DIR, '*.lang')))
+    split = [p for p in args.split.split(',') if p]
+    os.makedirs(args.out, exist_ok=True)
+
+    for path in files:
+        print(f"{path}:")
+        count = compile_lang(path, args.out, split)
+        print(f"  razem {count} kluczy")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+// langTable.js - Tablica tłumaczeń z plików skompilowanych przez compile_lang.py
+// Ładuje tylko potrzebne sekcje (tile/item/gui/misc), lookup przez hash w O(1)
+
+const LANG_DIR = './assets/minecraft/lang';
+const MAGIC = 0x5453434d; // 'MCST' (little-endian)
+const VERSION = 1; // Musi się zgadzać z VERSION w compile_lang.py
+const HEADER_SIZE = 16;
+const ENTRY_SIZE = 16;
+
+// FNV-1a 32-bit - ta sama funkcja jest w compile_lang.py
+function fnv1a(bytes) {
+    let h = 0x811c9dc5;
+    for (let i = 0; i < bytes.length; i++) {
+        h ^= bytes[i];
+        h = Math.imul(h, 0x01000193) >>> 0;
+    }
+    return h;
+}
+
+class LangSection {
+    constructor(buffer) {
+        this.view = new DataView(buffer);
+        this.bytes = new Uint8Array(buffer);
+
+        if (this.view.getUint32(0, true) !== MAGIC) {
+            throw new Error('Invalid lang section');
+        }
+
+        const version = this.view.getUint32(4, true);
+        if (version !== VERSION) {
+            throw new Error(`Unsupported lang section version ${version} (expected ${VERSION})`);
+        }
+
+        this.count = this.view.getUint32(8, true);
+        this.tableSize = this.view.getUint32(12, true);
+        this.entriesOffset = HEADER_SIZE + this.tableSize * 4;
+        this.stringsOffset = this.entriesOffset + this.count * ENTRY_SIZE;
+    }
+
+    get(keyBytes) {
+        const mask = this.tableSize - 1;
+        let slot = fnv1a(keyBytes) & mask;
+
+        while (true) {
+            const index = this.view.getUint32(HEADER_SIZE + slot * 4, true);
+            if (index === 0) return null; // Pusty slot = brak klucza
+
+            const entry = this.entriesOffset + (index - 1) * ENTRY_SIZE;
+            const keyOffset = this.stringsOffset + this.view.getUint32(entry, true);
+            const keyLength = this.view.getUint32(entry + 4, true);
+
+            if (this.keyEquals(keyBytes, keyOffset, keyLength)) {
+                const valueOffset = this.stringsOffset + this.view.getUint32(entry + 8, true);
+                const valueLength = this.view.getUint32(entry + 12, true);
+                return this.bytes.subarray(valueOffset, valueOffset + valueLength);
+            }
+
+            slot = (slot + 1) & mask;
+        }
+    }
+
+    keyEquals(keyBytes, offset, length) {
+        if (keyBytes.length !== length) return false;
+        for (let i = 0; i < length; i++) {
+            if (this.bytes[offset + i] !== keyBytes[i]) return false;
+        }
+        return true;
+    }
+}
+
+export class LangTable {
+    constructor(language = 'en_US') {
+        this.language = language;
+        this.manifest = null;
+        this.sections = {}; // Załadowane sekcje: nazwa -> LangSection
+        this.encoder = new TextEncoder();
+        this.decoder = new TextDecoder();
+
+        // Promise that resolves when index is loaded
+        this.loadingPromise = this.loadManifest();
+    }
+
+    async loadManifest() {
+        try {
+            const response = await fetch(`${LANG_DIR}/${this.language}.index.json`);
+            if (!response.ok) throw new Error(response.statusText);
+            this.manifest = await response.json();
+            console.log(`✓ LangTable index loaded (${this.language})`);
+        } catch (e) {
+            console.warn(`✗ Failed to load lang index (${this.language}):`, e);
+        }
+    }
+
+    sectionFor(key) {
+        const prefix = key.split('.', 1)[0];
+        return this.manifest.split.includes(prefix) ? prefix : this.manifest.rest;
+    }
+
+    // Załaduj sekcje z góry (np. ['gui', 'item'] dla GUI)
+    async loadSections(names) {
+        await this.loadingPromise;
+        if (!this.manifest) return;
+
+        await Promise.all(names.map(async (name) => {
+            if (this.sections[name]) return;
+            const info = this.manifest.sections[name];
+            if (!info) return;
+
+            try {
+                const response = await fetch(`${LANG_DIR}/${info.file}`);
+                if (!response.ok) throw new Error(response.statusText);
+                this.sections[name] = new LangSection(await response.arrayBuffer());
+            } catch (e) {
+                console.warn(`✗ Failed to load lang section ${name}:`, e);
+            }
+        }));
+    }
+
+    // Synchronicznie - zwraca klucz, jeśli sekcja nie jest jeszcze załadowana
+    translate(key) {
+        if (!this.manifest) return key;
+
+        const section = this.sections[this.sectionFor(key)];
+        if (!section) return key;
+
+        const value = section.get(this.encoder.encode(key));
+        return value ? this.decoder.decode(value) : key;
+    }
+}
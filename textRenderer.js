@@ -1,15 +1,52 @@
 // textRenderer.js - Uniwersalny renderer tekstu dla całej gry
 // Używany przez: liczby bloków (hotbar/inventory), chat, etc.
 
+const FONT_DIR = './assets/minecraft/textures/font';
+const MAX_TINT_COLORS = 16; // Limit kolorów w cache kolorowanych glifów
+
+// Wypieczony arkusz z bake_font.py (opcjonalny) - ładowany raz,
+// wspólny dla wszystkich instancji TextRenderer (GUI, chat)
+let bakedFontPromise = null;
+
+function loadBakedFont() {
+    if (!bakedFontPromise) {
+        bakedFontPromise = (async () => {
+            try {
+                const response = await fetch(`${FONT_DIR}/ascii_baked.json`);
+                if (!response.ok) return null;
+                const metrics = await response.json();
+
+                const sheet = new Image();
+                await new Promise((resolve, reject) => {
+                    sheet.onload = resolve;
+                    sheet.onerror = reject;
+                    sheet.src = `${FONT_DIR}/${metrics.image}`;
+                });
+
+                console.log('✓ TextRenderer baked font loaded');
+                return { sheet, metrics };
+            } catch (e) {
+                console.warn('Baked font not available, using runtime scaling');
+                return null;
+            }
+        })();
+    }
+    return bakedFontPromise;
+}
+
 export class TextRenderer {
     constructor() {
         this.fontAtlas = null; // ascii.png atlas
         this.charMap = this.createCharacterMap(); // Mapa znaków
-        this.canvasCache = {}; // Cache scaled textów
         this.fontLoaded = false;
+        this.bakedFont = null; // { sheet, metrics } z bake_font.py
+        this.tintCache = new Map(); // kolor -> 256 canvasów 8x8 (po slocie)
 
         // Promise that resolves when font is loaded
-        this.loadingPromise = this.loadFontAtlas();
+        this.loadingPromise = Promise.all([
+            this.loadFontAtlas(),
+            loadBakedFont().then((baked) => { this.bakedFont = baked; })
+        ]);
     }
 
     createCharacterMap() {
@@ -56,6 +93,14 @@ export class TextRenderer {
         });
     }
 
+    // Wariant z arkusza dla danej skali i koloru (null = brak)
+    getBakedVariant(scale, color) {
+        if (!this.bakedFont) return null;
+        const byScale = this.bakedFont.metrics.glyphs[scale];
+        if (!byScale) return null;
+        return byScale[color.toString(16).padStart(6, '0')] || null;
+    }
+
     measureCharacterWidths() {
         if (!this.fontAtlas) return;
 
@@ -101,7 +146,8 @@ export class TextRenderer {
     }
 
     // Rysuj tekst na canvas context (DOKŁADNIE JAK LICZBY!)
-    drawText(ctx, text, x, y, scale = 1, shadowConfig = null) {
+    // Glify z wypieczonego arkusza są kopiowane 1:1, reszta skalowana w runtime
+    drawText(ctx, text, x, y, scale = 1, shadowConfig = null, color = 0xFFFFFF) {
         if (!this.fontAtlas || !this.fontLoaded) {
             console.warn('Font atlas not ready');
             return;
@@ -110,6 +156,8 @@ export class TextRenderer {
         x = Math.round(x);
         y = Math.round(y);
 
+        const variant = this.getBakedVariant(scale, color);
+        const shadowVariant = shadowConfig ? this.getBakedVariant(scale, shadowConfig.color) : null;
         const digitSize = 8;
         let currentX = x;
 
@@ -119,162 +167,106 @@ export class TextRenderer {
 
             if (!charData) continue;
 
-            // Jeśli jest shadow config - rysuj cień (IDENTYCZNIE JAK LICZBY!)
+            // Slot w ascii.png = klucz glifu w arkuszu
+            const slot = (charData.y / digitSize) * 16 + charData.x / digitSize;
+            const glyph = variant && variant[slot];
+            const shadowGlyph = shadowVariant && shadowVariant[slot];
+
             if (shadowConfig) {
-                // Stwórz temp canvas z shadow kolorem (DOKŁADNIE JAK W LICZBACH!)
-                const shadowCanvas = document.createElement('canvas');
-                shadowCanvas.width = digitSize;
-                shadowCanvas.height = digitSize;
-                const shadowCtx = shadowCanvas.getContext('2d');
-                shadowCtx.imageSmoothingEnabled = false;
-
-                // Narysuj znaki na tymczasowym canvasie
-                shadowCtx.drawImage(
-                    this.fontAtlas,
-                    charData.x, charData.y, digitSize, digitSize,
-                    0, 0, digitSize, digitSize
-                );
+                const shadowX = Math.round(currentX + shadowConfig.offsetX * scale);
+                const shadowY = Math.round(y + shadowConfig.offsetY * scale);
 
-                // Zmień kolor na kolor cienia (IDENTYCZNIE JAK W LICZBACH!)
-                const imgData = shadowCtx.getImageData(0, 0, digitSize, digitSize);
-                const data = imgData.data;
-                const shadowR = (shadowConfig.color >> 16) & 0xff;
-                const shadowG = (shadowConfig.color >> 8) & 0xff;
-                const shadowB = shadowConfig.color & 0xff;
-
-                for (let j = 0; j < data.length; j += 4) {
-                    if (data[j + 3] > 0) {
-                        data[j] = shadowR;
-                        data[j + 1] = shadowG;
-                        data[j + 2] = shadowB;
-                    }
+                if (shadowGlyph) {
+                    this.drawBakedGlyph(ctx, slot, shadowGlyph, shadowX, shadowY, scale);
+                } else {
+                    this.drawTintedGlyph(ctx, charData, shadowX, shadowY, scale, shadowConfig.color);
                 }
-                shadowCtx.putImageData(imgData, 0, 0);
+            }
 
-                // Rysuj cień na głównym canvasie (IDENTYCZNIE JAK W LICZBACH!)
+            if (glyph) {
+                this.drawBakedGlyph(ctx, slot, glyph, Math.round(currentX), y, scale);
+            } else if (color === 0xFFFFFF) {
+                // Rysuj białą znak (IDENTYCZNIE JAK W LICZBACH!)
                 ctx.drawImage(
-                    shadowCanvas,
-                    Math.round(currentX + shadowConfig.offsetX * scale),
-                    Math.round(y + shadowConfig.offsetY * scale),
+                    this.fontAtlas,
+                    charData.x, charData.y, digitSize, digitSize,
+                    Math.round(currentX),
+                    y,
                     digitSize * scale,
                     digitSize * scale
                 );
+            } else {
+                this.drawTintedGlyph(ctx, charData, Math.round(currentX), y, scale, color);
             }
 
-            // Rysuj białą znak (IDENTYCZNIE JAK W LICZBACH!)
-            ctx.drawImage(
-                this.fontAtlas,
-                charData.x, charData.y, digitSize, digitSize,
-                Math.round(currentX),
-                y,
-                digitSize * scale,
-                digitSize * scale
-            );
-
             // Przejdź do następnego znaku
             const charWidth = charData.width || digitSize;
             currentX += (charWidth + 1) * scale;
         }
     }
 
-    // Pobierz główny canvas (biały tekst) z cache
-    getMainCanvas(charData, scale = 1) {
-        const cacheKey = `main_${charData.x}_${charData.y}_${scale}`;
+    // Skopiuj gotowy glif z arkusza 1:1 - bez skalowania
+    drawBakedGlyph(ctx, slot, glyph, x, y, scale) {
+        const { sheet, metrics } = this.bakedFont;
+        const width = metrics.widths[slot] * scale;
+        const height = metrics.glyphSize * scale;
 
-        if (this.canvasCache[cacheKey]) {
-            return this.canvasCache[cacheKey];
-        }
+        ctx.drawImage(sheet, glyph[0], glyph[1], width, height, x, y, width, height);
+    }
 
+    // Narysuj znak z atlasu w podanym kolorze (cień, kolorowy tekst)
+    drawTintedGlyph(ctx, charData, x, y, scale, color) {
         const digitSize = 8;
-        const tempCanvas = document.createElement('canvas');
-        tempCanvas.width = digitSize;
-        tempCanvas.height = digitSize;
-        const tempCtx = tempCanvas.getContext('2d');
-        tempCtx.imageSmoothingEnabled = false;
-
-        // Wyciągnij znak z atlasu
-        tempCtx.drawImage(
-            this.fontAtlas,
-            charData.x, charData.y, digitSize, digitSize,
-            0, 0, digitSize, digitSize
-        );
-
-        // Stwórz scaled canvas
-        const scaledCanvas = document.createElement('canvas');
-        scaledCanvas.width = digitSize * scale;
-        scaledCanvas.height = digitSize * scale;
-        const scaledCtx = scaledCanvas.getContext('2d');
-        scaledCtx.imageSmoothingEnabled = false;
-
-        // Rysuj scaled (drawImage - jak liczby!)
-        scaledCtx.drawImage(
-            tempCanvas,
-            0, 0, digitSize, digitSize,
-            0, 0, digitSize * scale, digitSize * scale
-        );
-
-        this.canvasCache[cacheKey] = scaledCanvas;
-        return scaledCanvas;
+        const tintCanvas = this.getTintedGlyph(charData, color);
+        ctx.drawImage(tintCanvas, x, y, digitSize * scale, digitSize * scale);
     }
 
-    // Pobierz shadow canvas z cache
-    getShadowCanvas(charData, scale = 1, shadowColor = 0x3f3f3f) {
-        const cacheKey = `shadow_${charData.x}_${charData.y}_${scale}_${shadowColor}`;
-
-        if (this.canvasCache[cacheKey]) {
-            return this.canvasCache[cacheKey];
+    // Kolorowany glif 8x8 z cache - max 256 na kolor, max MAX_TINT_COLORS kolorów
+    getTintedGlyph(charData, color) {
+        const digitSize = 8;
+        let byColor = this.tintCache.get(color);
+        if (!byColor) {
+            if (this.tintCache.size >= MAX_TINT_COLORS) {
+                // Usuń najstarszy kolor
+                this.tintCache.delete(this.tintCache.keys().next().value);
+            }
+            byColor = new Array(256);
+            this.tintCache.set(color, byColor);
         }
 
-        const digitSize = 8;
-        const tempCanvas = document.createElement('canvas');
-        tempCanvas.width = digitSize;
-        tempCanvas.height = digitSize;
-        const tempCtx = tempCanvas.getContext('2d');
-        tempCtx.imageSmoothingEnabled = false;
-
-        // Wyciągnij znak z atlasu
-        tempCtx.drawImage(
+        const slot = (charData.y / digitSize) * 16 + charData.x / digitSize;
+        if (byColor[slot]) return byColor[slot];
+
+        const tintCanvas = document.createElement('canvas');
+        tintCanvas.width = digitSize;
+        tintCanvas.height = digitSize;
+        const tintCtx = tintCanvas.getContext('2d');
+        tintCtx.imageSmoothingEnabled = false;
+
+        // Narysuj znak na tymczasowym canvasie
+        tintCtx.drawImage(
             this.fontAtlas,
             charData.x, charData.y, digitSize, digitSize,
             0, 0, digitSize, digitSize
         );
 
-        // Zmień kolor na shadow
-        const imgData = tempCtx.getImageData(0, 0, digitSize, digitSize);
+        // Zmień kolor (IDENTYCZNIE JAK W LICZBACH!)
+        const imgData = tintCtx.getImageData(0, 0, digitSize, digitSize);
         const data = imgData.data;
-        const shadowR = (shadowColor >> 16) & 0xff;
-        const shadowG = (shadowColor >> 8) & 0xff;
-        const shadowB = shadowColor & 0xff;
+        const r = (color >> 16) & 0xff;
+        const g = (color >> 8) & 0xff;
+        const b = color & 0xff;
 
         for (let j = 0; j < data.length; j += 4) {
             if (data[j + 3] > 0) {
-                data[j] = shadowR;
-                data[j + 1] = shadowG;
-                data[j + 2] = shadowB;
+                data[j] = r;
+                data[j + 1] = g;
+                data[j + 2] = b;
             }
         }
-        tempCtx.putImageData(imgData, 0, 0);
-
-        // Stwórz scaled canvas
-        const scaledCanvas = document.createElement('canvas');
-        scaledCanvas.width = digitSize * scale;
-        scaledCanvas.height = digitSize * scale;
-        const scaledCtx = scaledCanvas.getContext('2d');
-        scaledCtx.imageSmoothingEnabled = false;
-
-        // Rysuj scaled (drawImage - jak liczby!)
-        scaledCtx.drawImage(
-            tempCanvas,
-            0, 0, digitSize, digitSize,
-            0, 0, digitSize * scale, digitSize * scale
-        );
-
-        this.canvasCache[cacheKey] = scaledCanvas;
-        return scaledCanvas;
-    }
+        tintCtx.putImageData(imgData, 0, 0);
 
-    // Oczyść cache
-    clearCache() {
-        this.canvasCache = {};
+        byColor[slot] = tintCanvas;
+        return tintCanvas;
     }
 }